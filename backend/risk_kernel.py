@@ -0,0 +1,55 @@
+# backend/risk_kernel.py
+"""Numba-compiled core of the risk fusion.
+
+compute_risk in main.py stays the dict-facing wrapper; the arithmetic lives
+here as pure scalar math so it JITs cleanly and batches across sites with
+prange. Call warmup() once at startup so the first request never pays the
+compile cost.
+"""
+import numpy as np
+from numba import njit, prange
+
+# Local sensor thresholds: crack 25, vibration 12, piezo 20, tilt 25 (tune later)
+_CRACK_W = 60.0 / 25.0
+_VIB_W   = 20.0 / 12.0
+_PIEZO_W = 10.0 / 20.0
+_TILT_W  = 10.0 / 25.0
+
+
+@njit(cache=True, fastmath=True)
+def risk_score(rain_24h, precip_rate, wind, seis_mag, seis_count,
+               crack, vib, piezo, tilt):
+    """Fused risk score for one site; returns (score, local_factor)."""
+    rain_factor = min(100.0, max(0.0, rain_24h * 4.0))
+    rate_boost  = min(30.0, max(0.0, precip_rate * 6.0))
+    wind_factor = min(30.0, max(0.0, wind * 1.5))
+    seismic_factor = min(100.0, max(0.0, seis_mag * 15.0 + min(20.0, seis_count * 1.5)))
+    local_factor = min(100.0,
+        max(0.0, crack) * _CRACK_W +
+        max(0.0, vib)   * _VIB_W +
+        max(0.0, piezo) * _PIEZO_W +
+        max(0.0, tilt)  * _TILT_W
+    )
+    score = (0.4 * (rain_factor + rate_boost) + 0.25 * seismic_factor
+             + 0.15 * wind_factor + 0.20 * local_factor)
+    return min(100.0, score), local_factor
+
+
+@njit(parallel=True, cache=True, fastmath=True)
+def risk_batch(rain_24h, precip_rate, wind, seis_mag, seis_count,
+               crack, vib, piezo, tilt):
+    """Vectorized risk_score over (N,) float64 arrays, one entry per site."""
+    n = rain_24h.shape[0]
+    out = np.empty(n, dtype=np.float64)
+    for i in prange(n):
+        out[i], _ = risk_score(rain_24h[i], precip_rate[i], wind[i],
+                               seis_mag[i], seis_count[i],
+                               crack[i], vib[i], piezo[i], tilt[i])
+    return out
+
+
+def warmup():
+    """Trigger JIT compilation (or cache load) of both kernels."""
+    risk_score(0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0)
+    z = np.zeros(1)
+    risk_batch(z, z, z, z, z, z, z, z, z)
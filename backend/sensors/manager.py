@@ -1,114 +1,171 @@
-# backend/sensors/manager.py
-from __future__ import annotations
-import os, json, asyncio, time
-from dataclasses import dataclass, asdict
-from typing import Optional, Callable, Dict, Any
-
-# MQTT (async)
-from asyncio_mqtt import Client, MqttError
-# Serial (blocking -> run in thread)
-import serial
-
-@dataclass
-class LocalSensors:
-    tiltmeter: float = 15.0
-    piezometer: float = 12.0
-    vibration: float = 8.0
-    crackmeter: float = 18.0
-    status: str = "online"
-    ts: float = 0.0  # epoch
-
-class SensorManager:
-    """
-    Collects local sensor data from:
-      - MQTT topic (JSON lines)
-      - Serial port (one JSON per line)
-    Keeps latest reading in memory and can notify listeners.
-    """
-    def __init__(self) -> None:
-        self._latest: LocalSensors = LocalSensors(ts=time.time())
-        self._lock = asyncio.Lock()
-        self._on_update: Optional[Callable[[Dict[str, Any]], None]] = None
-        self._tasks: list[asyncio.Task] = []
-
-    # ---------- public ----------
-    def set_on_update(self, cb: Callable[[Dict[str, Any]], None]):
-        self._on_update = cb
-
-    async def start(self):
-        # create tasks conditionally
-        if os.getenv("MQTT_HOST"):
-            self._tasks.append(asyncio.create_task(self._mqtt_worker()))
-        if os.getenv("SERIAL_PORT"):
-            self._tasks.append(asyncio.create_task(self._serial_worker()))
-
-    async def stop(self):
-        for t in self._tasks:
-            t.cancel()
-        self._tasks.clear()
-
-    async def snapshot(self) -> Dict[str, Any]:
-        async with self._lock:
-            return asdict(self._latest)
-
-    # ---------- internals ----------
-    async def _update_from_payload(self, payload: dict):
-        # Accept keys: tiltmeter, piezometer, vibration, crackmeter, status
-        async with self._lock:
-            self._latest.tiltmeter   = float(payload.get("tiltmeter", self._latest.tiltmeter))
-            self._latest.piezometer  = float(payload.get("piezometer", self._latest.piezometer))
-            self._latest.vibration   = float(payload.get("vibration", self._latest.vibration))
-            self._latest.crackmeter  = float(payload.get("crackmeter", self._latest.crackmeter))
-            self._latest.status      = str(payload.get("status", self._latest.status))
-            self._latest.ts          = time.time()
-
-            data = asdict(self._latest)
-
-        if self._on_update:
-            # fire-and-forget
-            try:
-                self._on_update(data)
-            except Exception:
-                pass
-
-    # ---- MQTT ----
-    async def _mqtt_worker(self):
-        host = os.getenv("MQTT_HOST")
-        port = int(os.getenv("MQTT_PORT", "1883"))
-        user = os.getenv("MQTT_USERNAME")
-        pwd  = os.getenv("MQTT_PASSWORD")
-        topic = os.getenv("MQTT_TOPIC", "mine/sensors")
-
-        while True:
-            try:
-                async with Client(hostname=host, port=port, username=user, password=pwd) as client:
-                    await client.subscribe(topic)
-                    async with client.unfiltered_messages() as messages:
-                        async for msg in messages:
-                            try:
-                                payload = json.loads(msg.payload.decode("utf-8").strip())
-                                await self._update_from_payload(payload)
-                            except Exception:
-                                continue
-            except MqttError:
-                await asyncio.sleep(3)
-
-    # ---- Serial (blocking loop in thread) ----
-    def _serial_blocking_loop(self):
-        port = os.getenv("SERIAL_PORT")
-        baud = int(os.getenv("SERIAL_BAUD", "115200"))
-        ser = serial.Serial(port=port, baudrate=baud, timeout=1)
-        buf = b""
-        while True:
-            line = ser.readline()
-            if not line:
-                continue
-            try:
-                payload = json.loads(line.decode("utf-8").strip())
-            except Exception:
-                continue
-            # hand off to asyncio
-            asyncio.run_coroutine_threadsafe(self._update_from_payload(payload), asyncio.get_event_loop())
-
-    async def _serial_worker(self):
-        await asyncio.to_thread(self._serial_blocking_loop)
+# backend/sensors/manager.py
+from __future__ import annotations
+import os, asyncio, time
+from dataclasses import dataclass
+from typing import Optional, Callable, Dict, Any
+
+import orjson
+
+# MQTT (async)
+from asyncio_mqtt import Client, MqttError
+# Serial (blocking -> run in thread)
+import serial
+
+@dataclass(slots=True)
+class LocalSensors:
+    tiltmeter: float = 15.0
+    piezometer: float = 12.0
+    vibration: float = 8.0
+    crackmeter: float = 18.0
+    status: str = "online"
+    ts: float = 0.0  # epoch
+
+    def to_dict(self) -> Dict[str, Any]:
+        # asdict() goes through fields() reflection and recursive copy;
+        # the fields here are flat scalars, so a literal dict is far cheaper.
+        return {
+            "tiltmeter": self.tiltmeter,
+            "piezometer": self.piezometer,
+            "vibration": self.vibration,
+            "crackmeter": self.crackmeter,
+            "status": self.status,
+            "ts": self.ts,
+        }
+
+class SensorManager:
+    """
+    Collects local sensor data from:
+      - MQTT topic (JSON lines)
+      - Serial port (one JSON per line)
+    Keeps latest reading in memory and can notify listeners.
+    """
+    def __init__(self) -> None:
+        self._latest: LocalSensors = LocalSensors(ts=time.time())
+        # Readers take this reference without locking; writers replace it
+        # wholesale (rebinding is atomic in CPython) and never mutate it.
+        self._latest_dict: Dict[str, Any] = self._latest.to_dict()
+        self._lock = asyncio.Lock()
+        self._on_update: Optional[Callable[[Dict[str, Any]], None]] = None
+        self._tasks: list[asyncio.Task] = []
+        self._dirty = False
+        self._loop: Optional[asyncio.AbstractEventLoop] = None
+
+    # ---------- public ----------
+    def set_on_update(self, cb: Callable[[Dict[str, Any]], None]):
+        self._on_update = cb
+
+    async def start(self):
+        # create tasks conditionally
+        if os.getenv("MQTT_HOST"):
+            self._tasks.append(asyncio.create_task(self._mqtt_worker()))
+        if os.getenv("SERIAL_PORT"):
+            self._tasks.append(asyncio.create_task(self._serial_worker()))
+        self._tasks.append(asyncio.create_task(self._flush_loop()))
+
+    async def stop(self):
+        for t in self._tasks:
+            t.cancel()
+        self._tasks.clear()
+
+    async def snapshot(self) -> Dict[str, Any]:
+        return self._latest_dict
+
+    # ---------- internals ----------
+    def _merge_locked(self, payload: dict):
+        # Accept keys: tiltmeter, piezometer, vibration, crackmeter, status.
+        # Caller must hold self._lock.
+        self._latest.tiltmeter   = float(payload.get("tiltmeter", self._latest.tiltmeter))
+        self._latest.piezometer  = float(payload.get("piezometer", self._latest.piezometer))
+        self._latest.vibration   = float(payload.get("vibration", self._latest.vibration))
+        self._latest.crackmeter  = float(payload.get("crackmeter", self._latest.crackmeter))
+        self._latest.status      = str(payload.get("status", self._latest.status))
+        self._latest.ts          = time.time()
+
+    async def _update_from_payload(self, payload: dict):
+        async with self._lock:
+            self._merge_locked(payload)
+            # Publish a fresh dict in one rebind; the lock only guards the
+            # read-modify-write merge above, never the readers.
+            self._latest_dict = self._latest.to_dict()
+        # Broadcasts go out from _flush_loop so a high-rate stream coalesces
+        # into one notification per tick instead of one per message.
+        self._dirty = True
+
+    async def _update_from_payload_batch(self, payloads: list[dict]):
+        if not payloads:
+            return
+        async with self._lock:
+            for payload in payloads:
+                self._merge_locked(payload)
+            self._latest_dict = self._latest.to_dict()
+        self._dirty = True
+
+    async def _flush_loop(self, interval: float = 0.05):
+        while True:
+            await asyncio.sleep(interval)
+            if not self._dirty or not self._on_update:
+                continue
+            self._dirty = False
+            try:
+                self._on_update(self._latest_dict)
+            except Exception:
+                pass
+
+    # ---- MQTT ----
+    async def _mqtt_worker(self):
+        host = os.getenv("MQTT_HOST")
+        port = int(os.getenv("MQTT_PORT", "1883"))
+        user = os.getenv("MQTT_USERNAME")
+        pwd  = os.getenv("MQTT_PASSWORD")
+        topic = os.getenv("MQTT_TOPIC", "mine/sensors")
+
+        while True:
+            try:
+                async with Client(hostname=host, port=port, username=user, password=pwd) as client:
+                    await client.subscribe(topic)
+                    async with client.unfiltered_messages() as messages:
+                        async for msg in messages:
+                            try:
+                                # orjson takes the raw bytes; no decode/strip
+                                payload = orjson.loads(msg.payload)
+                                await self._update_from_payload(payload)
+                            except Exception:
+                                continue
+            except MqttError:
+                await asyncio.sleep(3)
+
+    # ---- Serial (blocking loop in thread) ----
+    def _serial_blocking_loop(self):
+        port = os.getenv("SERIAL_PORT")
+        baud = int(os.getenv("SERIAL_BAUD", "115200"))
+        ser = serial.Serial(port=port, baudrate=baud, timeout=1)
+        buf = b""
+        while True:
+            # Drain everything that has arrived (blocking for at least one
+            # byte) so a fast stream is decoded line-batch at a time.
+            data = ser.read(ser.in_waiting or 1)
+            if not data:
+                continue
+            buf += data
+            if b"\n" not in buf:
+                continue
+            *lines, buf = buf.split(b"\n")
+            payloads = []
+            for line in lines:
+                if not line.strip():
+                    continue
+                try:
+                    payloads.append(orjson.loads(line))
+                except Exception:
+                    continue
+            if payloads:
+                # hand off to asyncio: one loop wakeup per batch, not per line
+                asyncio.run_coroutine_threadsafe(
+                    self._update_from_payload_batch(payloads), self._loop
+                )
+
+    async def _serial_worker(self):
+        # Capture the running loop here; asyncio.get_event_loop() from the
+        # worker thread is deprecated and would not find this loop anyway.
+        self._loop = asyncio.get_running_loop()
+        await asyncio.to_thread(self._serial_blocking_loop)
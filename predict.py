@@ -1,25 +1,38 @@
-import sys
-import pickle
-import numpy as np
-
-# Load trained model and scaler
-with open("models/scaler.pkl", "rb") as f:
-    scaler = pickle.load(f)
-
-with open("models/model.pkl", "rb") as f:
-    model = pickle.load(f)
-
-# Read inputs from Node.js
-rainfall = float(sys.argv[1])
-temperature = float(sys.argv[2])
-slope = float(sys.argv[3])
-seismic = float(sys.argv[4])
-
-X = np.array([[rainfall, temperature, slope, seismic]])
-X_scaled = scaler.transform(X)
-
-# Predict
-prob = model.predict_proba(X_scaled)[0][1]
-risk = int(model.predict(X_scaled)[0])
-
-print({"risk": risk, "probability": round(float(prob), 2)})
\ No newline at end of file
+import sys
+import joblib
+import numpy as np
+
+# Load once at import and extract plain arrays so the prediction below is
+# pure numpy -- no sklearn dispatch in the hot path. joblib.load reads the
+# committed plain-pickle artifacts as well as joblib-format rewrites.
+scaler = joblib.load("models/scaler.pkl")
+model = joblib.load("models/model_logistic.pkl")
+
+W = model.coef_.ravel().astype(np.float32)
+B = float(model.intercept_[0])
+MU = scaler.mean_.astype(np.float32)
+INV_SIG = (1.0 / scaler.scale_).astype(np.float32)
+
+# Read inputs from Node.js: rainfall, temperature, slope, seismic
+_X = np.array([float(a) for a in sys.argv[1:]], dtype=np.float32)
+
+# Fail loudly on a feature-count mismatch instead of scoring garbage --
+# the model must be trained on exactly the features the CLI passes.
+if _X.shape[0] != W.shape[0]:
+    raise SystemExit(
+        f"predict.py: got {_X.shape[0]} inputs but the model expects "
+        f"{W.shape[0]} features; retrain train_model.py on the CLI features "
+        "or update the Server.js call to pass all of them"
+    )
+
+# Standardize in place against the precomputed mean and inverse scale,
+# so the prediction allocates no temporaries beyond the input buffer.
+np.subtract(_X, MU, out=_X)
+np.multiply(_X, INV_SIG, out=_X)
+
+# Predict: logistic regression is just sigmoid(x_scaled @ W + B)
+logit = float(_X @ W + B)
+prob = 1.0 / (1.0 + np.exp(-logit))
+risk = int(prob >= 0.5)
+
+print({"risk": risk, "probability": round(float(prob), 2)})
@@ -1,32 +1,48 @@
-# split_drone_dataset.py
-import os, shutil, random
-
-SRC = r"datasets\drone_dataset_raw"   # yahan unzip hua data hai
-DST = r"datasets\drone_dataset"       # final structure yahan बनेगा
-CLASSES = ["safe", "risk"]            # folder ke naam isi tarah hone chahiye
-SPLIT = 0.2                           # 20% val
-
-def ensure_dir(p):
-    os.makedirs(p, exist_ok=True)
-
-# final folders
-for s in ["train", "val"]:
-    for c in CLASSES:
-        ensure_dir(os.path.join(DST, s, c))
-
-# har class ke liye files uthao
-for c in CLASSES:
-    src_dir = os.path.join(SRC, c)
-    files = [f for f in os.listdir(src_dir) if f.lower().endswith((".jpg",".jpeg",".png",".bmp"))]
-    random.shuffle(files)
-
-    k = int(len(files) * SPLIT)
-    val_files = set(files[:k])
-
-    for f in files:
-        src = os.path.join(src_dir, f)
-        split = "val" if f in val_files else "train"
-        dst = os.path.join(DST, split, c, f)
-        shutil.copy2(src, dst)
-
-print("✅ Split complete. Final tree at:", DST)
\ No newline at end of file
+# split_drone_dataset.py
+import os, shutil, random
+from concurrent.futures import ThreadPoolExecutor
+
+SRC = r"datasets\drone_dataset_raw"   # yahan unzip hua data hai
+DST = r"datasets\drone_dataset"       # final structure yahan बनेगा
+CLASSES = ["safe", "risk"]            # folder ke naam isi tarah hone chahiye
+SPLIT = 0.2                           # 20% val
+WORKERS = 32                          # pure I/O, so threads scale fine
+
+def ensure_dir(p):
+    os.makedirs(p, exist_ok=True)
+
+def place(pair):
+    src, dst = pair
+    # Hardlink avoids rewriting the image bytes; fall back to a real copy
+    # when linking isn't possible (cross-device DST, unsupported fs).
+    try:
+        os.link(src, dst)
+    except OSError:
+        shutil.copy2(src, dst)
+
+# final folders
+for s in ["train", "val"]:
+    for c in CLASSES:
+        ensure_dir(os.path.join(DST, s, c))
+
+# har class ke liye files uthao; pehle saare (src, dst) pairs banao
+pairs = []
+for c in CLASSES:
+    src_dir = os.path.join(SRC, c)
+    with os.scandir(src_dir) as it:
+        files = [e.name for e in it
+                 if e.is_file() and e.name.lower().endswith((".jpg",".jpeg",".png",".bmp"))]
+    random.shuffle(files)
+
+    k = int(len(files) * SPLIT)
+    val_files = set(files[:k])
+
+    for f in files:
+        split = "val" if f in val_files else "train"
+        pairs.append((os.path.join(src_dir, f), os.path.join(DST, split, c, f)))
+
+# link/copy in parallel instead of one file at a time
+with ThreadPoolExecutor(max_workers=WORKERS) as ex:
+    list(ex.map(place, pairs))
+
+print("✅ Split complete. Final tree at:", DST)